@@ -11,6 +11,8 @@ Usage:
 Requirements:
     - requests
     - python-dotenv
+    - requests-cache (optional, for caching API responses between runs)
+    - liburing (optional, Linux only, for --io-backend uring)
 
 Setup:
     1. Create a GitHub Personal Access Token with 'repo' scope
@@ -19,11 +21,26 @@ Setup:
 
 import os
 import re
+import sys
 import json
 import argparse
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
 
 # Load environment variables
 load_dotenv()
@@ -42,23 +59,140 @@ HEADERS = {
     "Content-Type": "application/json",
 }
 
+# Directory for the on-disk HTTP cache (used when requests-cache is installed)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gh-scraper")
+
+# Seconds a cached GraphQL response is reused before querying GitHub again
+CACHE_TTL = 300
+
+def _is_cacheable(response):
+    """
+    Check whether a GraphQL response may be cached. GitHub reports errors
+    (including timeouts and rate limiting) with a 200 status, so responses
+    with an "errors" field are never cached.
+    """
+    try:
+        return "errors" not in response.json()
+    except ValueError:
+        return False
+
+# Shared session so requests reuse pooled keep-alive connections, retrying
+# transient failures and rate limiting (honouring Retry-After). POST is
+# retried too since every GraphQL request here is a read-only query. When
+# requests-cache is installed, GraphQL responses are cached on disk for
+# CACHE_TTL seconds, keyed on the query and its variables.
+if requests_cache:
+    SESSION = requests_cache.CachedSession(
+        os.path.join(CACHE_DIR, "discussions"),
+        backend="sqlite",
+        allowable_methods=["POST"],
+        expire_after=CACHE_TTL,
+        filter_fn=_is_cacheable
+    )
+else:
+    SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+# Patterns used to build filenames from discussion titles
+_FILENAME_STRIP = re.compile(r'[^\w\s-]')
+_WS = re.compile(r'\s+')
+
+# Maximum number of markdown files written concurrently
+MAX_WORKERS = 8
+
+# Number of files written per io_uring submission with --io-backend uring
+URING_BATCH_SIZE = 64
+
+# Maximum number of discussions requested per page (GitHub's connection limit)
+PAGE_SIZE = 100
+
+# Maximum number of repositories combined into one batched GraphQL query, to
+# stay within GitHub's node count and complexity limits
+MAX_BATCH_SIZE = 25
+
+# Maximum number of discussions whose comments are fetched in one batched query
+COMMENT_BATCH_SIZE = 20
+
+# Fields fetched for each discussion. Comments are fetched separately, see
+# fetch_comments().
+DISCUSSION_FRAGMENT = """
+fragment DiscussionFields on Discussion {
+  id
+  title
+  body
+  url
+  createdAt
+  author {
+    login
+  }
+  category {
+    name
+  }
+}
+"""
+
+# Queries for a page of a repository's discussions, with and without a
+# category filter
+_QUERY_NO_CATEGORY = """
+query($owner: String!, $repo: String!, $first: Int!, $cursor: String) {
+  repository(owner: $owner, name: $repo) {
+    discussions(first: $first, after: $cursor) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        ...DiscussionFields
+      }
+    }
+  }
+}
+""" + DISCUSSION_FRAGMENT
+
+_QUERY_WITH_CATEGORY = """
+query($owner: String!, $repo: String!, $first: Int!, $cursor: String, $categoryId: ID!) {
+  repository(owner: $owner, name: $repo) {
+    discussions(first: $first, after: $cursor, categoryId: $categoryId) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        ...DiscussionFields
+      }
+    }
+  }
+}
+""" + DISCUSSION_FRAGMENT
+
 def sanitize_filename(name):
     """Convert a string to a valid filename."""
     # Replace spaces and special characters
-    name = re.sub(r'[^\w\s-]', '', name.lower())
-    name = re.sub(r'[\s]+', '_', name)
+    name = _FILENAME_STRIP.sub('', name.lower())
+    name = _WS.sub('_', name)
     return name[:100]  # Limit filename length
 
-def format_discussion_as_markdown(discussion, include_comments=False):
+def _iter_markdown(discussion, include_comments=False):
     """
-    Format a discussion as markdown content.
+    Yield the markdown content for a discussion piece by piece.
     
     Args:
         discussion: The discussion data from GitHub API
         include_comments: Whether to include comments in the output
     
-    Returns:
-        str: Formatted markdown content
+    Yields:
+        str: Successive chunks of markdown content
     """
     # Basic discussion metadata
     title = discussion["title"]
@@ -68,77 +202,47 @@ def format_discussion_as_markdown(discussion, include_comments=False):
     url = discussion["url"]
     
     # Format the discussion header
-    md_content = f"# {title}\n\n"
-    md_content += f"**Author:** [{author}](https://github.com/{author})  \n"
-    md_content += f"**Created:** {created_at}  \n"
-    md_content += f"**URL:** {url}  \n\n"
-    md_content += f"## Discussion\n\n{body}\n\n"
+    yield (
+        f"# {title}\n\n"
+        f"**Author:** [{author}](https://github.com/{author})  \n"
+        f"**Created:** {created_at}  \n"
+        f"**URL:** {url}  \n\n"
+        f"## Discussion\n\n{body}\n\n"
+    )
     
     # Add comments if enabled and available
     if include_comments and "comments" in discussion and discussion["comments"]["nodes"]:
-        md_content += "## Comments\n\n"
+        yield "## Comments\n\n"
         for comment in discussion["comments"]["nodes"]:
             comment_author = comment["author"]["login"] if comment["author"] else "Anonymous"
-            md_content += f"### [{comment_author}](https://github.com/{comment_author}) - {comment['createdAt']}\n\n"
-            md_content += f"{comment['body']}\n\n"
-    
-    return md_content
+            yield f"### [{comment_author}](https://github.com/{comment_author}) - {comment['createdAt']}\n\n{comment['body']}\n\n"
 
-def fetch_discussions(owner, repo, category=None, limit=10):
+def format_discussion_as_markdown(discussion, include_comments=False):
     """
-    Fetch discussions from a GitHub repository using GraphQL API.
+    Format a discussion as markdown content.
     
     Args:
-        owner: Repository owner (username or organization)
-        repo: Repository name
-        category: Optional category name to filter discussions
-        limit: Maximum number of discussions to fetch
+        discussion: The discussion data from GitHub API
+        include_comments: Whether to include comments in the output
     
     Returns:
-        list: List of discussion data
-    """
-    # Build the GraphQL query
-    category_filter = f', categoryId: "{category}"' if category else ""
-    query = """
-    query($owner: String!, $repo: String!, $limit: Int!) {
-      repository(owner: $owner, name: $repo) {
-        discussions(first: $limit%s) {
-          nodes {
-            id
-            title
-            body
-            url
-            createdAt
-            author {
-              login
-            }
-            category {
-              name
-            }
-            comments(first: 50) {
-              nodes {
-                author {
-                  login
-                }
-                body
-                createdAt
-              }
-            }
-          }
-        }
-      }
-    }
-    """ % category_filter
+        str: Formatted markdown content
+    """
+    return "".join(_iter_markdown(discussion, include_comments))
+
+def run_query(query, variables):
+    """
+    Run a GraphQL query against the GitHub API.
     
-    # Variables for the GraphQL query
-    variables = {
-        "owner": owner,
-        "repo": repo,
-        "limit": limit
-    }
+    Args:
+        query: GraphQL query document
+        variables: Variables for the query
     
+    Returns:
+        dict: The "data" field of the GraphQL response
+    """
     # Make the request
-    response = requests.post(
+    response = SESSION.post(
         GITHUB_API,
         headers=HEADERS,
         json={"query": query, "variables": variables}
@@ -154,72 +258,457 @@ def fetch_discussions(owner, repo, category=None, limit=10):
     if "errors" in result:
         raise Exception(f"GraphQL query error: {json.dumps(result['errors'], indent=2)}")
     
-    # Extract and return discussions
-    return result["data"]["repository"]["discussions"]["nodes"]
+    return result["data"]
 
-def save_discussion_as_markdown(discussion, output_dir, include_comments=False):
+def fetch_comments(discussions):
+    """
+    Fetch all comments for a list of discussions and store them on each
+    discussion under "comments".
+    
+    Comments for up to COMMENT_BATCH_SIZE discussions are requested in each
+    GraphQL request using aliased node lookups, paging through each
+    discussion's comments until none are left. The batches in each round are
+    independent, so they are sent concurrently.
+    
+    Args:
+        discussions: List of discussion data (must include "id")
+    
+    Returns:
+        list: The same discussions, with comments added
+    """
+    for discussion in discussions:
+        discussion["comments"] = {"nodes": []}
+    cursors = [None] * len(discussions)
+    pending = list(range(len(discussions)))
+    
+    while pending:
+        still_pending = []
+        batches = []
+        
+        for start in range(0, len(pending), COMMENT_BATCH_SIZE):
+            batch = pending[start:start + COMMENT_BATCH_SIZE]
+            
+            # Build one aliased node lookup (and its variables) per discussion
+            declarations = []
+            selections = []
+            variables = {}
+            for i, index in enumerate(batch):
+                declarations.append(f"$id{i}: ID!, $c{i}: String")
+                selections.append(
+                    f"d{i}: node(id: $id{i}) {{ ... on Discussion {{ "
+                    f"comments(first: {PAGE_SIZE}, after: $c{i}) {{ "
+                    f"pageInfo {{ hasNextPage endCursor }} nodes {{ author {{ login }} body createdAt }} }} }} }}"
+                )
+                variables[f"id{i}"] = discussions[index]["id"]
+                variables[f"c{i}"] = cursors[index]
+            
+            query = "query(%s) {\n%s\n}\n" % (", ".join(declarations), "\n".join(selections))
+            batches.append((batch, query, variables))
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            responses = executor.map(lambda batch: run_query(batch[1], batch[2]), batches)
+            
+            # Merge each page of comments into its discussion, in batch order
+            for (batch, _, _), data in zip(batches, responses):
+                for i, index in enumerate(batch):
+                    # The discussion may have been deleted or become inaccessible
+                    # since it was fetched; treat it as having no more comments
+                    if data[f"d{i}"] is None:
+                        continue
+                    
+                    comments = data[f"d{i}"]["comments"]
+                    discussions[index]["comments"]["nodes"].extend(comments["nodes"])
+                    
+                    if comments["pageInfo"]["hasNextPage"]:
+                        cursors[index] = comments["pageInfo"]["endCursor"]
+                        still_pending.append(index)
+        
+        pending = still_pending
+    
+    return discussions
+
+def fetch_discussions(owner, repo, category=None, limit=10, include_comments=False):
+    """
+    Fetch discussions from a GitHub repository using GraphQL API.
+    
+    Discussions are requested in pages of up to PAGE_SIZE, following the
+    connection's endCursor until the limit is reached, and yielded as each
+    page arrives.
+    
+    Args:
+        owner: Repository owner (username or organization)
+        repo: Repository name
+        category: Optional category name to filter discussions
+        limit: Maximum number of discussions to fetch
+        include_comments: Whether to also fetch each discussion's comments
+    
+    Yields:
+        dict: Discussion data
+    """
+    query = _QUERY_WITH_CATEGORY if category else _QUERY_NO_CATEGORY
+    
+    remaining = limit
+    cursor = None
+    
+    while remaining > 0:
+        # Variables for the GraphQL query
+        variables = {
+            "owner": owner,
+            "repo": repo,
+            "first": min(PAGE_SIZE, remaining),
+            "cursor": cursor
+        }
+        if category:
+            variables["categoryId"] = category
+        
+        discussions = run_query(query, variables)["repository"]["discussions"]
+        
+        if include_comments:
+            fetch_comments(discussions["nodes"])
+        
+        yield from discussions["nodes"]
+        remaining -= len(discussions["nodes"])
+        
+        # Stop once there are no more pages
+        if not discussions["pageInfo"]["hasNextPage"]:
+            break
+        cursor = discussions["pageInfo"]["endCursor"]
+
+def fetch_discussions_batched(targets, category=None, limit=10, include_comments=False):
+    """
+    Fetch discussions from several repositories, combining up to
+    MAX_BATCH_SIZE repositories into each GraphQL request using query aliases.
+    
+    Each round requests the next page for every repository that still has
+    discussions left to fetch, until all of them reach the limit or run out.
+    The batches in each round are independent, so they are sent concurrently.
+    
+    Args:
+        targets: List of (owner, repo) tuples
+        category: Optional category to filter discussions. Category IDs belong
+            to a single repository, so this only makes sense when every target
+            shares that category
+        limit: Maximum number of discussions to fetch per repository
+        include_comments: Whether to also fetch each discussion's comments
+    
+    Returns:
+        list: One list of discussion data per target, in the same order as targets
+    """
+    category_filter = ", categoryId: $categoryId" if category else ""
+    results = [[] for _ in targets]
+    cursors = [None] * len(targets)
+    pending = list(range(len(targets))) if limit > 0 else []
+    
+    while pending:
+        still_pending = []
+        batches = []
+        
+        for start in range(0, len(pending), MAX_BATCH_SIZE):
+            batch = pending[start:start + MAX_BATCH_SIZE]
+            
+            # Build one aliased repository selection (and its variables) per target
+            declarations = ["$categoryId: ID!"] if category else []
+            selections = []
+            variables = {"categoryId": category} if category else {}
+            for i, index in enumerate(batch):
+                owner, repo = targets[index]
+                declarations.append(f"$o{i}: String!, $r{i}: String!, $f{i}: Int!, $c{i}: String")
+                selections.append(
+                    f"repo{i}: repository(owner: $o{i}, name: $r{i}) {{ "
+                    f"discussions(first: $f{i}, after: $c{i}{category_filter}) {{ "
+                    f"pageInfo {{ hasNextPage endCursor }} nodes {{ ...DiscussionFields }} }} }}"
+                )
+                variables[f"o{i}"] = owner
+                variables[f"r{i}"] = repo
+                variables[f"f{i}"] = min(PAGE_SIZE, limit - len(results[index]))
+                variables[f"c{i}"] = cursors[index]
+            
+            query = "query(%s) {\n%s\n}\n" % (", ".join(declarations), "\n".join(selections)) + DISCUSSION_FRAGMENT
+            batches.append((batch, query, variables))
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            responses = executor.map(lambda batch: run_query(batch[1], batch[2]), batches)
+            
+            # Split the aliased results back out per target, in batch order
+            for (batch, _, _), data in zip(batches, responses):
+                for i, index in enumerate(batch):
+                    discussions = data[f"repo{i}"]["discussions"]
+                    results[index].extend(discussions["nodes"])
+                    
+                    if discussions["pageInfo"]["hasNextPage"] and len(results[index]) < limit:
+                        cursors[index] = discussions["pageInfo"]["endCursor"]
+                        still_pending.append(index)
+        
+        pending = still_pending
+    
+    if include_comments:
+        fetch_comments([discussion for discussions in results for discussion in discussions])
+    
+    return results
+
+def markdown_filepath(discussion, output_dir, strict_dates=False):
+    """
+    Build the path of the markdown file for a discussion.
+    
+    Args:
+        discussion: The discussion data
+        output_dir: Directory the file is saved in
+        strict_dates: Whether to fully parse and validate the creation timestamp
+    
+    Returns:
+        str: Path to the markdown file
+    """
+    # Create a filename from the discussion title. GitHub timestamps are always
+    # "YYYY-MM-DDTHH:MM:SSZ", so the date prefix can be sliced straight out.
+    created_at = discussion["createdAt"]
+    if strict_dates or len(created_at) < 10:
+        date_prefix = datetime.fromisoformat(created_at.replace("Z", "+00:00")).strftime("%Y%m%d")
+    else:
+        date_prefix = created_at[:10].replace("-", "")
+    filename = f"{date_prefix}-{sanitize_filename(discussion['title'])}.md"
+    return os.path.join(output_dir, filename)
+
+def save_discussion_as_markdown(discussion, output_dir, include_comments=False, strict_dates=False):
     """
     Save a discussion as a markdown file.
     
     Args:
         discussion: The discussion data
-        output_dir: Directory to save the file
+        output_dir: Directory to save the file (must already exist)
         include_comments: Whether to include comments in the output
+        strict_dates: Whether to fully parse and validate the creation timestamp
     
     Returns:
         str: Path to the saved file
     """
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
+    filepath = markdown_filepath(discussion, output_dir, strict_dates)
     
-    # Create a filename from the discussion title
-    date_prefix = datetime.fromisoformat(discussion["createdAt"].replace("Z", "+00:00")).strftime("%Y%m%d")
-    filename = f"{date_prefix}-{sanitize_filename(discussion['title'])}.md"
-    filepath = os.path.join(output_dir, filename)
-    
-    # Format the discussion as markdown
-    md_content = format_discussion_as_markdown(discussion, include_comments)
-    
-    # Save to file
+    # Stream the formatted markdown to file
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write(md_content)
+        f.writelines(_iter_markdown(discussion, include_comments))
     
     return filepath
 
+def save_discussions_threaded(executor, discussions, output_dir, include_comments=False, strict_dates=False):
+    """
+    Save discussions as markdown files using a thread pool.
+    
+    At most 2 * MAX_WORKERS writes are in flight at once, so discussions are
+    only pulled from the iterable (and further pages fetched) as earlier
+    writes complete. A file still being written is never written again
+    concurrently; the earlier write is finished first, so the later
+    discussion wins as it would with sequential writes.
+    
+    Args:
+        executor: ThreadPoolExecutor to run the writes on
+        discussions: Iterable of discussion data
+        output_dir: Directory to save the files (must already exist)
+        include_comments: Whether to include comments in the output
+        strict_dates: Whether to fully parse and validate creation timestamps
+    
+    Yields:
+        str: Path of each saved file, in the order of discussions
+    """
+    in_flight = deque()
+    
+    for discussion in discussions:
+        filepath = markdown_filepath(discussion, output_dir, strict_dates)
+        
+        # Wait for earlier writes while the window is full or one of them
+        # is to the same file
+        while in_flight and (len(in_flight) >= 2 * MAX_WORKERS
+                             or any(path == filepath for path, _ in in_flight)):
+            yield in_flight.popleft()[1].result()
+        
+        in_flight.append((filepath, executor.submit(
+            save_discussion_as_markdown, discussion, output_dir, include_comments, strict_dates
+        )))
+    
+    while in_flight:
+        yield in_flight.popleft()[1].result()
+
+class UringBatchEngine:
+    """
+    Write files in batches through a Linux io_uring, so that each batch of
+    writes (and the fsyncs that follow) is handed to the kernel in a single
+    submission rather than one write() call per file.
+    
+    Requires Linux and the liburing package.
+    """
+    
+    def __init__(self, batch_size=URING_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.ring = liburing.Ring()
+        liburing.io_uring_queue_init(batch_size, self.ring)
+        self.cqe = liburing.Cqe()
+    
+    def close(self):
+        """Release the ring."""
+        liburing.io_uring_queue_exit(self.ring)
+    
+    def write_all(self, files):
+        """
+        Write files in batches of up to batch_size.
+        
+        Args:
+            files: Iterable of (path, data) tuples, with data as bytes
+        
+        Yields:
+            str: Path of each file once it has been written and synced
+        """
+        batch = []
+        for path, data in files:
+            # Write out the pending batch first if it already has this path,
+            # so the later content wins as it would with sequential writes
+            if len(batch) == self.batch_size or any(path == pending for pending, _ in batch):
+                yield from self._write_batch(batch)
+                batch = []
+            batch.append((path, data))
+        
+        if batch:
+            yield from self._write_batch(batch)
+    
+    def _submit(self, prep, operations):
+        """
+        Queue one operation per file, submit them together and wait for all
+        of them to complete.
+        
+        Args:
+            prep: liburing function that prepares an operation on a
+                submission queue entry (e.g. io_uring_prep_write)
+            operations: List of argument tuples for prep, one per operation
+        
+        Returns:
+            list: The result of each operation, in the same order as operations
+        """
+        for index, args in enumerate(operations):
+            sqe = liburing.io_uring_get_sqe(self.ring)
+            prep(sqe, *args)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        liburing.io_uring_submit_and_wait(self.ring, len(operations))
+        
+        # Completions can arrive in any order, so match them up by user data
+        results = [None] * len(operations)
+        for _ in operations:
+            liburing.io_uring_wait_cqe(self.ring, self.cqe)
+            cqe = self.cqe[0]
+            results[liburing.io_uring_cqe_get_data64(cqe)] = cqe.res
+            liburing.io_uring_cqe_seen(self.ring, cqe)
+        
+        return results
+    
+    def _write_batch(self, batch):
+        """Write and fsync one batch of files, yielding each path when done."""
+        fds = []
+        try:
+            for path, _ in batch:
+                fds.append(os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644))
+            
+            # The data buffers in batch stay referenced until the writes complete
+            written = self._submit(liburing.io_uring_prep_write,
+                                   [(fd, data, 0) for fd, (_, data) in zip(fds, batch)])
+            for fd, (path, data), result in zip(fds, batch, written):
+                if result < 0:
+                    raise OSError(-result, os.strerror(-result), path)
+                # Finish off any short write synchronously
+                while result < len(data):
+                    result += os.pwrite(fd, data[result:], result)
+            
+            synced = self._submit(liburing.io_uring_prep_fsync, [(fd,) for fd in fds])
+            for (path, _), result in zip(batch, synced):
+                if result < 0:
+                    raise OSError(-result, os.strerror(-result), path)
+        finally:
+            for fd in fds:
+                os.close(fd)
+        
+        for path, _ in batch:
+            yield path
+
 def main():
     """Main function to run the script."""
     parser = argparse.ArgumentParser(description="Fetch discussions from a GitHub repository")
     parser.add_argument("--owner", required=True, help="Repository owner (username or organization)")
-    parser.add_argument("--repo", required=True, help="Repository name")
+    parser.add_argument("--repo", required=True, nargs="+",
+                        help="Repository name (pass several to fetch from multiple repositories in batched queries)")
     parser.add_argument("--category", help="Filter by category name")
     parser.add_argument("--output-dir", default="discussions", help="Directory to save markdown files")
     parser.add_argument("--limit", type=int, default=10, help="Maximum number of discussions to fetch")
     parser.add_argument("--include-comments", action="store_true", help="Include comments in the output")
+    parser.add_argument("--no-cache", action="store_true", help="Don't use or update the on-disk response cache")
+    parser.add_argument("--strict-dates", action="store_true",
+                        help="Fully parse and validate discussion timestamps instead of slicing the date out")
+    parser.add_argument("--io-backend", choices=["thread", "uring"], default="thread",
+                        help="How markdown files are written: a thread pool, or batched io_uring submissions "
+                             "(Linux with the liburing package only; default: thread)")
     
     args = parser.parse_args()
     
-    print(f"Fetching up to {args.limit} discussions from {args.owner}/{args.repo}...")
+    # Category IDs belong to a single repository, so they can't filter several
+    if args.category and len(args.repo) > 1:
+        parser.error("--category can only be used with a single --repo")
+    
+    if args.no_cache and requests_cache:
+        SESSION.settings.disabled = True
+    
+    # Set up io_uring writes if requested, falling back to the thread pool
+    engine = None
+    if args.io_backend == "uring":
+        if liburing and sys.platform.startswith("linux"):
+            try:
+                engine = UringBatchEngine()
+            except OSError as e:
+                print(f"Warning: io_uring is unavailable ({e}), using threaded writes instead.")
+        else:
+            print("Warning: --io-backend uring needs Linux and the liburing package, using threaded writes instead.")
+    
+    targets = [(args.owner, repo) for repo in args.repo]
+    print(f"Fetching up to {args.limit} discussions from {', '.join(f'{o}/{r}' for o, r in targets)}...")
     
     try:
-        # Fetch discussions
-        discussions = fetch_discussions(args.owner, args.repo, args.category, args.limit)
+        # Fetch discussions, batching the queries when there are several repositories
+        if len(targets) == 1:
+            results = [fetch_discussions(args.owner, args.repo[0], args.category, args.limit, args.include_comments)]
+        else:
+            results = fetch_discussions_batched(targets, args.category, args.limit, args.include_comments)
         
         # Create output directory if specified
         output_dir = args.output_dir
         if not os.path.isabs(output_dir):
             output_dir = os.path.join(os.getcwd(), output_dir)
         
-        print(f"Found {len(discussions)} discussions")
-        
-        # Save each discussion as markdown
-        for i, discussion in enumerate(discussions, 1):
-            filepath = save_discussion_as_markdown(discussion, output_dir, args.include_comments)
-            print(f"[{i}/{len(discussions)}] Saved: {os.path.basename(filepath)}")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for (owner, repo), discussions in zip(targets, results):
+                # Keep each repository's discussions apart when fetching several
+                repo_output_dir = output_dir if len(targets) == 1 else os.path.join(output_dir, repo)
+                os.makedirs(repo_output_dir, exist_ok=True)
+                
+                # Save each discussion as markdown as it arrives, writing files concurrently
+                # while later pages are still being fetched
+                if engine:
+                    saved = engine.write_all(
+                        (markdown_filepath(discussion, repo_output_dir, args.strict_dates),
+                         format_discussion_as_markdown(discussion, args.include_comments).encode("utf-8"))
+                        for discussion in discussions
+                    )
+                else:
+                    saved = save_discussions_threaded(executor, discussions, repo_output_dir,
+                                                      args.include_comments, args.strict_dates)
+                
+                count = 0
+                for count, filepath in enumerate(saved, 1):
+                    print(f"[{count}] Saved: {os.path.basename(filepath)}")
+                
+                print(f"Saved {count} discussions from {owner}/{repo}")
         
         print(f"\nAll discussions saved to {output_dir}")
     
     except Exception as e:
         print(f"Error: {e}")
+    
+    finally:
+        if engine:
+            engine.close()
 
 if __name__ == "__main__":
     main()
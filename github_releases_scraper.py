@@ -15,6 +15,10 @@ Usage:
 Requirements:
     - requests
     - python-dotenv
+    - requests-cache (optional, for caching API responses between runs)
+    - orjson (optional, for faster JSON export)
+    - msgspec (optional, for faster decoding of API responses)
+    - ijson (optional, for incremental parsing of API responses)
 
 Setup:
     1. Create a GitHub Personal Access Token (classic) with 'repo' scope
@@ -22,12 +26,40 @@ Setup:
 """
 
 import os
+import re
 import argparse
 import requests
 import json
 import csv
+import operator
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Load environment variables
 load_dotenv()
@@ -47,108 +79,239 @@ HEADERS = {
     "X-GitHub-Api-Version": "2022-11-28"
 }
 
-def fetch_releases(owner, repo, limit=10, fetch_all=False):
+# Patterns used to extract major.minor versions from release tags
+_MAJOR_MINOR = re.compile(r'(\d+\.\d+)(?:\.\d+)?')
+_EXACT_MM = re.compile(r'^\d+\.\d+$')
+
+# Row format for the releases table
+RELEASE_ROW_FORMAT = "{:<20} {:<15} {:<30} {:<12} {:<10} {:<10}"
+
+# Labels for boolean flags in the releases table, indexed by the flag
+_YN = ("No", "Yes")
+
+# Release fields used by extract_release_info; everything else is dropped
+# as soon as each page is parsed
+RELEASE_FIELDS = ("tag_name", "name", "published_at", "created_at", "html_url", "prerelease", "draft")
+
+# A release reduced to RELEASE_FIELDS. With msgspec, API responses are decoded
+# straight into this struct, skipping every other field.
+if msgspec:
+    class Release(msgspec.Struct):
+        tag_name: str
+        name: Optional[str] = None
+        published_at: Optional[str] = None
+        created_at: Optional[str] = None
+        html_url: Optional[str] = None
+        prerelease: bool = False
+        draft: bool = False
+else:
+    Release = namedtuple("Release", RELEASE_FIELDS)
+
+# Write buffer size for CSV export
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# Default maximum number of release pages fetched concurrently. Kept small to
+# stay clear of GitHub's secondary rate limits.
+MAX_WORKERS = 8
+
+# Directory for the on-disk HTTP cache (used when requests-cache is installed)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gh-scraper")
+
+# Shared session so pages reuse pooled keep-alive connections, retrying
+# transient failures and rate limiting (honouring Retry-After). When
+# requests-cache is installed, responses are cached on disk and revalidated
+# with If-None-Match, so unchanged pages come back as 304s that don't count
+# against the rate limit.
+if requests_cache:
+    SESSION = requests_cache.CachedSession(
+        os.path.join(CACHE_DIR, "releases"),
+        backend="sqlite",
+        cache_control=True,
+        expire_after=requests_cache.EXPIRE_IMMEDIATELY
+    )
+else:
+    SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+def fetch_releases_page(url, params=None):
+    """
+    Fetch a single page of releases.
+    
+    Args:
+        url: Releases API URL for the repository, or a pagination link
+        params: Optional query parameters (e.g. page and per_page)
+    
+    Returns:
+        tuple: (response, releases) with the page's releases as Release objects
+    """
+    response = SESSION.get(url, headers=HEADERS, params=params, stream=True)
+    
+    # Check for errors
+    if response.status_code != 200:
+        raise Exception(f"API request failed with status code {response.status_code}. Response: {response.text}")
+    
+    # Decode straight into Release structs with msgspec when available
+    if msgspec:
+        return response, msgspec.json.decode(response.content, type=List[Release])
+    
+    # Otherwise parse the response, streaming it through ijson when available
+    # so that only one full release is held in memory at a time
+    if ijson:
+        if hasattr(response, "from_cache"):
+            # requests-cache has already read the body in order to store it
+            items = ijson.items(response.content, "item")
+        else:
+            response.raw.decode_content = True
+            items = ijson.items(response.raw, "item")
+    else:
+        items = response.json()
+    
+    releases = [Release(**{field: release.get(field) for field in RELEASE_FIELDS}) for release in items]
+    
+    return response, releases
+
+def fetch_releases(owner, repo, limit=10, fetch_all=False, max_workers=MAX_WORKERS):
     """
     Fetch releases from a GitHub repository using REST API.
     
+    The first page is fetched on its own to read the total page count from
+    the Link header's rel="last" link; the remaining pages are then fetched
+    concurrently over the shared session. If GitHub gives no page count, the
+    rel="next" links are followed one at a time until there are none left.
+    
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
         limit: Maximum number of releases to fetch (ignored if fetch_all is True)
         fetch_all: Whether to fetch all releases
+        max_workers: Maximum number of pages to fetch concurrently
     
     Returns:
-        list: List of release data
+        list: List of Release objects
     """
-    releases = []
-    page = 1
-    per_page = 100  # GitHub API max per page
-    
-    while True:
-        # Build the API URL
-        url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases"
-        params = {"page": page, "per_page": per_page}
-        
-        # Make the request
-        response = requests.get(url, headers=HEADERS, params=params)
-        
-        # Check for errors
-        if response.status_code != 200:
-            raise Exception(f"API request failed with status code {response.status_code}. Response: {response.text}")
-        
-        # Parse the response
-        page_releases = response.json()
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases"
+    # GitHub API max per page is 100; don't ask for more than the limit needs
+    per_page = 100 if fetch_all else min(100, max(1, limit))
+    
+    # Fetch the first page and work out how many pages there are
+    response, releases = fetch_releases_page(url, {"page": 1, "per_page": per_page})
+    
+    if "last" in response.links:
+        last_page = int(parse_qs(urlparse(response.links["last"]["url"]).query)["page"][0])
         
-        # Add releases to our list
-        releases.extend(page_releases)
+        # If we're not fetching all, only request the pages needed to reach the limit
+        if not fetch_all:
+            last_page = min(last_page, -(-limit // per_page))
         
-        # If we got fewer results than per_page, we've reached the end
-        if len(page_releases) < per_page:
-            break
-            
-        # If we've reached the limit and not fetching all, stop
-        if not fetch_all and len(releases) >= limit:
-            releases = releases[:limit]  # Trim to limit
-            break
-            
-        # Move to the next page
-        page += 1
+        # Fetch the remaining pages concurrently (map preserves page order)
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages = executor.map(
+                    lambda page: fetch_releases_page(url, {"page": page, "per_page": per_page}),
+                    range(2, last_page + 1)
+                )
+                for _, page_releases in pages:
+                    releases.extend(page_releases)
+    else:
+        # No page count given, so follow the rel="next" links until there are none
+        while "next" in response.links and (fetch_all or len(releases) < limit):
+            response, page_releases = fetch_releases_page(response.links["next"]["url"])
+            releases.extend(page_releases)
+    
+    # Trim to limit if not fetching all
+    if not fetch_all:
+        releases = releases[:limit]
     
     return releases
 
-def extract_release_info(releases):
+def _extract_major_minor(tag):
+    """
+    Extract the major.minor version from a release tag.
+    
+    Args:
+        tag: Release tag name (e.g. "v24.1.1")
+    
+    Returns:
+        str: The major.minor version prefixed with "v" (e.g. "v24.1"), or None
+    """
+    # Remove leading 'v' or 'V' if present
+    if tag.lower().startswith('v'):
+        tag = tag[1:]
+    
+    # First, try to find major.minor.patch pattern
+    version_match = _MAJOR_MINOR.search(tag)
+    if version_match:
+        return f"v{version_match.group(1)}"
+    
+    # If no match found, check if the tag itself is a major.minor version
+    if _EXACT_MM.match(tag):
+        return f"v{tag}"
+    
+    # If still no match found
+    return None
+
+def _date_part(timestamp, strict_dates=False):
+    """
+    Get the date part of a GitHub timestamp.
+    
+    GitHub timestamps are always "YYYY-MM-DDTHH:MM:SSZ", so the date is
+    simply the first 10 characters; the full parser is only used when
+    strict_dates is set or the timestamp is too short to slice.
+    
+    Args:
+        timestamp: ISO 8601 timestamp from the GitHub API, or None
+        strict_dates: Whether to validate the timestamp by fully parsing it
+    
+    Returns:
+        str: The date as YYYY-MM-DD, or None if there is no timestamp
+    """
+    if not timestamp:
+        return None
+    if strict_dates or len(timestamp) < 10:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).strftime("%Y-%m-%d")
+    return timestamp[:10]
+
+def extract_release_info(releases, strict_dates=False):
     """
     Extract relevant information from release data.
     
     Args:
-        releases: List of release data from GitHub API
+        releases: List of Release objects from fetch_releases
+        strict_dates: Whether to fully parse and validate release timestamps
     
     Returns:
         list: List of dictionaries with extracted release information
     """
     release_info = []
-    import re
     
     for release in releases:
         # Extract relevant fields
         info = {
-            "tag_name": release["tag_name"],
-            "name": release["name"] if release["name"] else release["tag_name"],
-            "published_at": release["published_at"],
-            "created_at": release["created_at"],
-            "url": release["html_url"],
-            "prerelease": release["prerelease"],
-            "draft": release["draft"]
+            "tag_name": release.tag_name,
+            "name": release.name if release.name else release.tag_name,
+            "published_at": release.published_at,
+            "created_at": release.created_at,
+            "url": release.html_url,
+            "prerelease": release.prerelease,
+            "draft": release.draft
         }
         
         # Extract major.minor version
-        tag = info["tag_name"]
-        # Remove leading 'v' or 'V' if present
-        if tag.lower().startswith('v'):
-            tag = tag[1:]
-        
-        # Try to extract major.minor using regex
-        # First, try to find major.minor.patch pattern
-        version_match = re.search(r'(\d+\.\d+)(?:\.\d+)?', tag)
-        if version_match:
-            info["major_minor"] = f"v{version_match.group(1)}"
-        else:
-            # If no match found, check if the tag itself is a major.minor version
-            if re.match(r'^\d+\.\d+$', tag):
-                info["major_minor"] = f"v{tag}"
-            else:
-                # If still no match found, set to None
-                info["major_minor"] = None
+        info["major_minor"] = _extract_major_minor(info["tag_name"])
         
         # Format dates
-        if info["published_at"]:
-            published_date = datetime.fromisoformat(info["published_at"].replace("Z", "+00:00"))
-            info["published_date"] = published_date.strftime("%Y-%m-%d")
-            info["published_datetime"] = published_date
-        else:
-            info["published_date"] = None
-            info["published_datetime"] = None
-            
+        info["published_date"] = _date_part(info["published_at"], strict_dates)
+        
         release_info.append(info)
     
     return release_info
@@ -163,9 +326,10 @@ def filter_major_releases(releases_info):
     Returns:
         list: List of dictionaries with only major releases (first of each major.minor)
     """
-    # Sort releases by published date (newest first)
+    # Sort releases by published date (newest first); GitHub's ISO 8601
+    # timestamps sort chronologically as plain strings
     sorted_releases = sorted(releases_info, 
-                           key=lambda x: x["published_datetime"] if x["published_datetime"] else datetime.min, 
+                           key=lambda x: x["published_at"] if x["published_at"] else "", 
                            reverse=True)
     
     # Track which major.minor versions we've seen
@@ -179,7 +343,7 @@ def filter_major_releases(releases_info):
             major_releases.append(release)
     
     # Sort the result back by published date (newest first)
-    major_releases.sort(key=lambda x: x["published_datetime"] if x["published_datetime"] else datetime.min, 
+    major_releases.sort(key=lambda x: x["published_at"] if x["published_at"] else "", 
                        reverse=True)
     
     return major_releases
@@ -192,32 +356,49 @@ def display_releases(releases_info):
         releases_info: List of dictionaries with release information
     """
     # Print header
-    print("\n{:<20} {:<15} {:<30} {:<12} {:<10} {:<10}".format(
+    print("\n" + RELEASE_ROW_FORMAT.format(
         "Version", "Major.Minor", "Name", "Release Date", "Prerelease", "Draft"
     ))
     print("-" * 100)
     
-    # Print each release
+    # Build every row up front (truncating long names once) so the print
+    # loop is plain formatting
+    rows = []
     for release in releases_info:
-        print("{:<20} {:<15} {:<30} {:<12} {:<10} {:<10}".format(
+        name = release["name"]
+        rows.append((
             release["tag_name"],
-            release["major_minor"] if release["major_minor"] else "N/A",
-            release["name"][:27] + "..." if len(release["name"]) > 30 else release["name"],
-            release["published_date"] if release["published_date"] else "N/A",
-            "Yes" if release["prerelease"] else "No",
-            "Yes" if release["draft"] else "No"
+            release["major_minor"] or "N/A",
+            name[:27] + "..." if len(name) > 30 else name,
+            release["published_date"] or "N/A",
+            _YN[bool(release["prerelease"])],
+            _YN[bool(release["draft"])]
         ))
+    
+    # Print each release
+    for row in rows:
+        print(RELEASE_ROW_FORMAT.format(*row))
 
-def save_as_json(releases_info, output_file):
+def save_as_json(releases_info, output_file, pretty=False):
     """
     Save release information as JSON.
     
+    Uses orjson when it is installed, falling back to the standard library.
+    
     Args:
         releases_info: List of dictionaries with release information
         output_file: Path to the output file
+        pretty: Whether to indent the output (compact by default)
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(releases_info, f, indent=2)
+    if orjson:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(releases_info, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(releases_info, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(releases_info, f, separators=(",", ":"), ensure_ascii=False)
     
     return output_file
 
@@ -229,13 +410,14 @@ def save_as_csv(releases_info, output_file):
         releases_info: List of dictionaries with release information
         output_file: Path to the output file
     """
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+    # A large write buffer keeps big exports to a handful of write() calls
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
         fieldnames = ["tag_name", "major_minor", "name", "published_date", "url", "prerelease", "draft"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        get_row = operator.itemgetter(*fieldnames)
+        writer = csv.writer(f)
         
-        writer.writeheader()
-        for release in releases_info:
-            writer.writerow({k: release[k] for k in fieldnames})
+        writer.writerow(fieldnames)
+        writer.writerows(map(get_row, releases_info))
     
     return output_file
 
@@ -244,8 +426,6 @@ def test_major_minor_extraction():
     Test the major.minor version extraction for various version formats.
     This is a development function to verify the regex pattern works correctly.
     """
-    import re
-    
     test_cases = [
         # Standard formats
         ("v1.2.3", "v1.2"),
@@ -279,23 +459,7 @@ def test_major_minor_extraction():
     results = []
     
     for test_case, expected in test_cases:
-        tag = test_case
-        # Remove leading 'v' or 'V' if present
-        if tag.lower().startswith('v'):
-            tag = tag[1:]
-            
-        # First, try to find major.minor.patch pattern
-        version_match = re.search(r'(\d+\.\d+)(?:\.\d+)?', tag)
-        if version_match:
-            major_minor = f"v{version_match.group(1)}"
-        else:
-            # If no match found, check if the tag itself is a major.minor version
-            if re.match(r'^\d+\.\d+$', tag):
-                major_minor = f"v{tag}"
-            else:
-                # If still no match found, set to None
-                major_minor = None
-                
+        major_minor = _extract_major_minor(test_case)
         results.append((test_case, major_minor, expected, major_minor == expected))
     
     # Print results
@@ -324,7 +488,13 @@ def main():
     parser.add_argument("--format", choices=["table", "json", "csv"], default="table", 
                         help="Output format (default: table)")
     parser.add_argument("--output", help="Output file for JSON or CSV format")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output (compact by default)")
     parser.add_argument("--overwrite", action="store_true", help="Overwrite existing output file if it exists")
+    parser.add_argument("--max-workers", type=int, default=MAX_WORKERS,
+                        help=f"Maximum number of release pages to fetch concurrently (default: {MAX_WORKERS})")
+    parser.add_argument("--no-cache", action="store_true", help="Don't use or update the on-disk response cache")
+    parser.add_argument("--strict-dates", action="store_true",
+                        help="Fully parse and validate release timestamps instead of slicing the date out")
     parser.add_argument("--test", action="store_true", help="Run tests for major.minor version extraction")
     
     args = parser.parse_args()
@@ -337,6 +507,9 @@ def main():
     if not args.owner or not args.repo:
         parser.error("--owner and --repo are required unless using --test")
     
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+    
     # Check output file exists before making API calls
     if args.format != "table":
         # Determine output filename if not specified
@@ -366,16 +539,19 @@ def main():
             print(f"Error: Invalid limit value '{args.limit}'. Use a number or 'all'.")
             return
     
+    if args.no_cache and requests_cache:
+        SESSION.settings.disabled = True
+    
     print(f"Fetching {limit_str} releases from {args.owner}/{args.repo}...")
     if args.major_only:
         print("Filtering to show only major releases (first of each major.minor version)...")
     
     try:
         # Fetch releases
-        releases = fetch_releases(args.owner, args.repo, limit if limit else 1000, fetch_all)
+        releases = fetch_releases(args.owner, args.repo, limit if limit else 1000, fetch_all, args.max_workers)
         
         # Extract relevant information
-        releases_info = extract_release_info(releases)
+        releases_info = extract_release_info(releases, args.strict_dates)
         
         # Filter to major releases only if requested
         if args.major_only:
@@ -389,7 +565,7 @@ def main():
         else:
             # Save to file (filename already determined and checked above)
             if args.format == "json":
-                filepath = save_as_json(releases_info, args.output)
+                filepath = save_as_json(releases_info, args.output, args.pretty)
             elif args.format == "csv":
                 filepath = save_as_csv(releases_info, args.output)
                 